@@ -1,13 +1,21 @@
 from strip_bom.core import (
     strip_bom,
     strip_bom_buffer,
+    strip_bom_buffer_bytes,
+    strip_bom_buffer_bytearray,
     strip_bom_stream,
+    strip_bom_stream_bytes,
+    strip_bom_copy,
     strip_bom_file,
 )
 
 __all__ = [
     'strip_bom',
     'strip_bom_buffer',
+    'strip_bom_buffer_bytes',
+    'strip_bom_buffer_bytearray',
     'strip_bom_stream',
+    'strip_bom_stream_bytes',
+    'strip_bom_copy',
     'strip_bom_file',
 ]
@@ -1,9 +1,16 @@
-from typing import Union, BinaryIO, Iterator
+import codecs
+import io
+import os
+from functools import partial
+from typing import IO, Final, Optional, Union, BinaryIO, Iterator
 
 # UTF-8 BOM bytes: 0xEF 0xBB 0xBF
-UTF8_BOM = b'\xef\xbb\xbf'
+UTF8_BOM: Final = b'\xef\xbb\xbf'
+_BOM_LEN: Final = len(UTF8_BOM)
 # UTF-8 BOM character: U+FEFF
-UTF8_BOM_CHAR = '\ufeff'
+UTF8_BOM_CHAR: Final = '\ufeff'
+# Longest UTF-8 encoded code point, in bytes
+_UTF8_MAX_CHAR_LEN: Final = 4
 
 
 def strip_bom(string: str) -> str:
@@ -28,76 +35,196 @@ def strip_bom(string: str) -> str:
     
     # Catches EFBBBF (UTF-8 BOM) because when a UTF-8 string with BOM
     # is read, the BOM is represented as the character U+FEFF
-    if string and string[0] == UTF8_BOM_CHAR:
+    if string.startswith(UTF8_BOM_CHAR):
         return string[1:]
     
     return string
 
 
-def _is_utf8(byte_array: bytes) -> bool:
+def _is_bom_legit(data: Union[bytes, bytearray, memoryview], final: bool = True) -> bool:
     """
-    Check if a byte array is valid UTF-8 encoded.
+    Check if a leading UTF-8 BOM is followed by valid UTF-8.
+    
+    A coincidental 0xEF 0xBB 0xBF prefix in non-UTF-8 data shows up as invalid
+    bytes right after it, so only the first code point after the BOM is
+    checked. Whether the rest of the data is valid does not change that.
     
     Args:
-        byte_array: Bytes to check
+        data: Bytes starting with a UTF-8 BOM
+        final: If False, data may be only the start of a larger input, so a
+               multi-byte sequence cut off at its end is accepted
         
     Returns:
-        True if the bytes are valid UTF-8, False otherwise
+        True if the BOM is followed by nothing or by a valid UTF-8 sequence, False otherwise
     """
+    window = data[_BOM_LEN:_BOM_LEN + _UTF8_MAX_CHAR_LEN]
     try:
-        byte_array.decode('utf-8', errors='strict')
+        codecs.utf_8_decode(window, 'strict', final)
         return True
-    except UnicodeDecodeError:
-        return False
+    except UnicodeDecodeError as e:
+        # An error past offset 0 belongs to a later code point
+        return e.start > 0
 
 
-def strip_bom_buffer(byte_array: Union[bytes, bytearray]) -> bytes:
+def strip_bom_buffer(byte_array: Union[bytes, bytearray, memoryview]) -> bytes:
     """
     Strip UTF-8 byte order mark (BOM) from a byte array.
     
-    Only strips the BOM if the buffer is actually valid UTF-8 encoded.
+    Only strips the BOM if the bytes following it start a valid UTF-8 sequence.
+    Just the first code point after the BOM is checked, so the cost does not
+    depend on the buffer size; the rest is left for the caller to decode.
+    
+    A memoryview (for example over an mmap) is read in place, so callers do not
+    need to copy it to bytes first. It must be C-contiguous. The result is
+    always a new bytes object, so memoryview input without a BOM is still
+    copied in full.
     
     Args:
         byte_array: Input bytes that may contain a UTF-8 BOM (0xEF 0xBB 0xBF)
         
     Returns:
-        Bytes with BOM removed if present and valid UTF-8, otherwise the original bytes
+        Bytes with BOM removed if present and followed by valid UTF-8, otherwise the original bytes
         
     Raises:
-        TypeError: If input is not bytes or bytearray
+        TypeError: If input is not bytes, bytearray, or a C-contiguous memoryview
         
     Example:
         >>> strip_bom_buffer(b'\\xef\\xbb\\xbfunicorn')
         b'unicorn'
     """
-    if not isinstance(byte_array, (bytes, bytearray)):
-        raise TypeError(f'Expected bytes or bytearray, got {type(byte_array).__name__}')
+    # Exact type checks cover the common inputs; subclasses and memoryview
+    # fall through to the isinstance gate below
+    cls = type(byte_array)
+    if cls is bytes:
+        return strip_bom_buffer_bytes(byte_array)
+    elif cls is bytearray:
+        return strip_bom_buffer_bytearray(byte_array)
     
-    # Convert bytearray to bytes for consistency
+    if not isinstance(byte_array, (bytes, bytearray, memoryview)):
+        raise TypeError(f'Expected bytes, bytearray, or memoryview, got {cls.__name__}')
+    
+    if isinstance(byte_array, bytes):
+        return strip_bom_buffer_bytes(byte_array)
     if isinstance(byte_array, bytearray):
-        byte_array = bytes(byte_array)
+        return strip_bom_buffer_bytearray(byte_array)
+    
+    # memoryview: flatten to unsigned bytes so slices are taken at byte offsets
+    view = memoryview(byte_array).cast('B')
+    if view[:_BOM_LEN] == UTF8_BOM and _is_bom_legit(view):
+        return bytes(view[_BOM_LEN:])
+    
+    return bytes(view)
+
+
+def strip_bom_buffer_bytes(byte_array: bytes) -> bytes:
+    """
+    Strip UTF-8 byte order mark (BOM) from bytes.
     
+    Specialized form of strip_bom_buffer for hot loops where the input is known
+    to be bytes. The input type is not checked.
+    
+    Args:
+        byte_array: Input bytes that may contain a UTF-8 BOM (0xEF 0xBB 0xBF)
+        
+    Returns:
+        Bytes with BOM removed if present and followed by valid UTF-8, otherwise the same bytes object
+        
+    Example:
+        >>> strip_bom_buffer_bytes(b'\\xef\\xbb\\xbfunicorn')
+        b'unicorn'
+    """
     # Check for UTF-8 BOM: 0xEF 0xBB 0xBF
-    if len(byte_array) >= len(UTF8_BOM) and byte_array[:len(UTF8_BOM)] == UTF8_BOM:
-        # Only strip if the buffer is actually valid UTF-8
-        if _is_utf8(byte_array):
-            return byte_array[len(UTF8_BOM):]
+    if byte_array.startswith(UTF8_BOM) and _is_bom_legit(byte_array):
+        return byte_array[_BOM_LEN:]
     
     return byte_array
 
 
-def strip_bom_stream(file_like: BinaryIO, chunk_size: int = 8192) -> Iterator[bytes]:
+def strip_bom_buffer_bytearray(byte_array: bytearray) -> bytes:
+    """
+    Strip UTF-8 byte order mark (BOM) from a bytearray.
+    
+    Specialized form of strip_bom_buffer for hot loops where the input is known
+    to be a bytearray. The input type is not checked.
+    
+    Args:
+        byte_array: Input bytearray that may contain a UTF-8 BOM (0xEF 0xBB 0xBF)
+        
+    Returns:
+        New bytes object with BOM removed if present and followed by valid UTF-8, otherwise a copy of the input
+        
+    Example:
+        >>> strip_bom_buffer_bytearray(bytearray(b'\\xef\\xbb\\xbfunicorn'))
+        b'unicorn'
+    """
+    if byte_array.startswith(UTF8_BOM) and _is_bom_legit(byte_array):
+        # Slice through a memoryview so the input is copied only once
+        return bytes(memoryview(byte_array)[_BOM_LEN:])
+    
+    return bytes(byte_array)
+
+
+def _header_incomplete(header: Union[bytes, bytearray]) -> bool:
+    """
+    Check if more bytes are needed to decide whether a stream starts with a real BOM.
+    
+    Args:
+        header: Bytes read so far from the start of the stream
+        
+    Returns:
+        True if the header is shorter than a BOM, or starts with a BOM but does
+        not yet hold the code point after it
+    """
+    if len(header) < _BOM_LEN:
+        return True
+    return len(header) < _BOM_LEN + _UTF8_MAX_CHAR_LEN and header.startswith(UTF8_BOM)
+
+
+def _read_first_chunk(file_like: BinaryIO, chunk_size: int) -> bytes:
+    """
+    Read the first chunk of a stream, making sure it is long enough to check for a BOM.
+    
+    Pipes, sockets and raw streams may return fewer bytes than requested, so
+    reads continue until the chunk holds the BOM length, plus one code point
+    if it starts with a BOM, or the stream ends. A chunk that starts with a
+    BOM and is shorter than that is therefore the whole stream.
+    
+    Args:
+        file_like: File-like object opened in binary mode
+        chunk_size: Size of chunks to read
+        
+    Returns:
+        First chunk of the stream, empty if the stream is empty
+    """
+    # Read first chunk (at least enough bytes to check for BOM, use chunk_size for consistency)
+    first_chunk = file_like.read(max(_BOM_LEN, chunk_size))
+    if not first_chunk or not _header_incomplete(first_chunk):
+        return first_chunk
+    
+    # Short read: accumulate into a bytearray to avoid repeated concatenation
+    header = bytearray(first_chunk)
+    while _header_incomplete(header):
+        chunk = file_like.read(chunk_size)
+        if not chunk:
+            break
+        header += chunk
+    
+    return bytes(header)
+
+
+def strip_bom_stream(file_like: BinaryIO, chunk_size: int = 65536) -> Iterator[bytes]:
     """
     Strip UTF-8 byte order mark (BOM) from a stream/file-like object.
     
     Reads the first chunk using chunk_size (at least 3 bytes to check for BOM),
-    checks for BOM, strips it if present and the data is valid UTF-8,
+    checks for BOM, strips it if present and followed by valid UTF-8,
     then yields all remaining data in chunks of chunk_size.
     
     Args:
         file_like: File-like object opened in binary mode
-        chunk_size: Size of chunks to read (default: 8192). The first chunk will
-                   be at least this size (or 3 bytes, whichever is larger).
+        chunk_size: Size of chunks to read (default: 65536). The first chunk will
+                   be at least this size (or 3 bytes, whichever is larger, and
+                   7 bytes if it starts with a BOM).
         
     Yields:
         Bytes chunks with BOM removed from the first chunk
@@ -115,36 +242,170 @@ def strip_bom_stream(file_like: BinaryIO, chunk_size: int = 8192) -> Iterator[by
     
     # Generator function that processes the stream
     def _strip_bom_stream_generator():
-        # Read first chunk (at least enough bytes to check for BOM, use chunk_size for consistency)
-        min_read_size = max(len(UTF8_BOM), chunk_size)
-        first_chunk = file_like.read(min_read_size)
+        first_chunk = _read_first_chunk(file_like, chunk_size)
         
         if not first_chunk:
             return
         
-        # Process first chunk with strip_bom_buffer to handle BOM removal
-        processed_first = strip_bom_buffer(first_chunk)
+        # Strip the BOM only if the code point after it is valid UTF-8. A chunk
+        # too short to hold that code point is the whole stream, so a sequence
+        # cut off at its end is an error only then
+        final = len(first_chunk) < _BOM_LEN + _UTF8_MAX_CHAR_LEN
+        if first_chunk.startswith(UTF8_BOM) and _is_bom_legit(first_chunk, final):
+            rest = first_chunk[_BOM_LEN:]
+            # Nothing to yield if the chunk held only the BOM
+            if rest:
+                yield rest
+        else:
+            # The chunk is non-empty and unchanged, so it passes through as is
+            yield first_chunk
         
-        # Yield processed first chunk (BOM removed if it was present)
-        if processed_first:
-            yield processed_first
-        
-        # Yield the rest of the file in chunks
-        while True:
-            chunk = file_like.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
+        # Yield the rest of the file in chunks, letting iter() drive the reads
+        yield from iter(partial(file_like.read, chunk_size), b'')
     
     return _strip_bom_stream_generator()
 
 
-def strip_bom_file(file_path: str, mode: str = 'r') -> Union[str, bytes]:
+def strip_bom_stream_bytes(file_like: BinaryIO) -> bytes:
+    """
+    Read a whole stream/file-like object and strip the UTF-8 byte order mark (BOM).
+    
+    Unlike strip_bom_stream, the content is read in a single call and returned
+    directly, without the overhead of a generator. Prefer it for small streams.
+    
+    Args:
+        file_like: File-like object opened in binary mode
+        
+    Returns:
+        Stream contents with BOM removed if present and followed by valid UTF-8
+        
+    Raises:
+        TypeError: If input is not a file-like object
+        
+    Example:
+        >>> strip_bom_stream_bytes(io.BytesIO(b'\\xef\\xbb\\xbfunicorn'))
+        b'unicorn'
+    """
+    if not hasattr(file_like, 'read'):
+        raise TypeError(f'Expected a file-like object, got {type(file_like).__name__}')
+    
+    return strip_bom_buffer(file_like.read())
+
+
+def _sendfile_rest(src: BinaryIO, dst: BinaryIO, chunk_size: int) -> Optional[int]:
+    """
+    Copy the rest of src to dst with os.sendfile.
+    
+    Args:
+        src: Source file object, positioned where copying should start
+        dst: Destination file object
+        chunk_size: Maximum number of bytes per sendfile call
+        
+    Returns:
+        Number of bytes copied, or None if sendfile cannot be used for these objects
+    """
+    if not hasattr(os, 'sendfile'):
+        return None
+    
+    try:
+        in_fd = src.fileno()
+        out_fd = dst.fileno()
+        offset = src.tell()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file descriptor, or not seekable (pipes, sockets)
+        return None
+    
+    # Anything buffered in dst must reach the descriptor before sendfile writes
+    dst.flush()
+    
+    copied = 0
+    while True:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset + copied, chunk_size)
+        except OSError:
+            # The descriptor types are not supported; nothing was copied yet,
+            # so the caller can still fall back to a read/write loop
+            if copied == 0:
+                return None
+            raise
+        if sent == 0:
+            break
+        copied += sent
+    
+    # sendfile bypasses the file objects, so bring their positions in line
+    src.seek(offset + copied)
+    if dst.seekable():
+        dst.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+    
+    return copied
+
+
+def strip_bom_copy(src: BinaryIO, dst: BinaryIO, chunk_size: int = 1 << 20) -> int:
+    """
+    Copy a stream/file-like object to another, stripping the UTF-8 byte order mark (BOM).
+    
+    The first chunk is written with the BOM removed if present and followed by
+    valid UTF-8. When both objects are backed by file descriptors and os.sendfile
+    supports them, the rest is copied by the kernel without passing through
+    Python; otherwise it is copied in chunks of chunk_size.
+    
+    Args:
+        src: Source file-like object opened in binary mode
+        dst: Destination file-like object opened in binary mode
+        chunk_size: Size of chunks to copy (default: 1 MiB)
+        
+    Returns:
+        Number of bytes written to dst
+        
+    Raises:
+        TypeError: If src or dst is not a file-like object
+        
+    Example:
+        >>> with open('in.txt', 'rb') as src, open('out.txt', 'wb') as dst:
+        ...     strip_bom_copy(src, dst)
+        7
+    """
+    if not hasattr(src, 'read'):
+        raise TypeError(f'Expected a file-like object, got {type(src).__name__}')
+    if not hasattr(dst, 'write'):
+        raise TypeError(f'Expected a writable file-like object, got {type(dst).__name__}')
+    
+    first_chunk = _read_first_chunk(src, chunk_size)
+    if not first_chunk:
+        return 0
+    
+    # Same first-chunk handling as strip_bom_stream
+    final = len(first_chunk) < _BOM_LEN + _UTF8_MAX_CHAR_LEN
+    if first_chunk.startswith(UTF8_BOM) and _is_bom_legit(first_chunk, final):
+        first_chunk = first_chunk[_BOM_LEN:]
+    dst.write(first_chunk)
+    written = len(first_chunk)
+    
+    copied = _sendfile_rest(src, dst, chunk_size)
+    if copied is not None:
+        return written + copied
+    
+    for chunk in iter(partial(src.read, chunk_size), b''):
+        dst.write(chunk)
+        written += len(chunk)
+    
+    return written
+
+
+def strip_bom_file(file_path: Union[str, IO], mode: str = 'r') -> Union[str, bytes]:
     """
     Convenience function to read a file and strip BOM.
     
+    Text mode decodes with Python's built-in utf-8-sig codec, which removes a
+    single leading BOM as part of decoding. Binary mode uses strip_bom_buffer.
+    
+    An already open file object (or io.BytesIO/io.StringIO) can be passed
+    instead of a path; it is read in full and left open. In text mode, bytes
+    read from it are decoded as UTF-8 with universal newlines, the same as
+    reading from a path.
+    
     Args:
-        file_path: Path to the file
+        file_path: Path to the file, or an open file object
         mode: File mode ('r' or 'rt' for text, 'rb' for binary)
         
     Returns:
@@ -152,6 +413,7 @@ def strip_bom_file(file_path: str, mode: str = 'r') -> Union[str, bytes]:
         
     Raises:
         ValueError: If mode is not 'r', 'rt', or 'rb'
+        TypeError: If mode is 'rb' and the file object returns str
         FileNotFoundError: If the file does not exist
         
     Example:
@@ -159,13 +421,26 @@ def strip_bom_file(file_path: str, mode: str = 'r') -> Union[str, bytes]:
         >>> print(content)
         'unicorn'
     """
-    if mode in ('r', 'rt'):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    if mode not in ('r', 'rt', 'rb'):
+        raise ValueError(f"Mode must be 'r', 'rt', or 'rb', got '{mode}'")
+    
+    if hasattr(file_path, 'read'):
+        content = file_path.read()
+        if mode == 'rb':
+            return strip_bom_buffer(content)
+        if isinstance(content, str):
             return strip_bom(content)
-    elif mode == 'rb':
+        # Translate newlines as open() does in text mode, so a file object
+        # gives the same result as its path
+        decoder = io.IncrementalNewlineDecoder(None, translate=True)
+        return decoder.decode(codecs.decode(content, 'utf-8-sig'), final=True)
+    
+    if mode in ('r', 'rt'):
+        # The utf-8-sig codec drops a leading BOM while decoding, avoiding a
+        # second pass over the decoded string
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            return f.read()
+    else:
         with open(file_path, 'rb') as f:
             content = f.read()
             return strip_bom_buffer(content)
-    else:
-        raise ValueError(f"Mode must be 'r', 'rt', or 'rb', got '{mode}'")
@@ -0,0 +1,40 @@
+import pytest
+from pathlib import Path
+
+
+@pytest.fixture(scope='session')
+def utf8_fixture_path():
+    """Path to tests/fixtures/fixture-utf8, a UTF-8 file starting with a BOM."""
+    return str(Path(__file__).parent / 'fixtures' / 'fixture-utf8')
+
+
+@pytest.fixture(scope='session')
+def utf8_fixture_bytes(utf8_fixture_path):
+    """Raw contents of the UTF-8 fixture file, read once per session."""
+    return Path(utf8_fixture_path).read_bytes()
+
+
+@pytest.fixture(scope='session')
+def bom():
+    """UTF-8 byte order mark: 0xEF 0xBB 0xBF."""
+    return b'\xef\xbb\xbf'
+
+
+@pytest.fixture(scope='session')
+def make_payload(bom):
+    """Factory for a UTF-8 BOM followed by size copies of a fill byte."""
+    def _make_payload(size, fill=b'x'):
+        return bom + fill * size
+    return _make_payload
+
+
+@pytest.fixture(scope='session')
+def large_payload(make_payload):
+    """BOM followed by 10000 b'x' bytes, built once per session."""
+    return make_payload(10000)
+
+
+@pytest.fixture(scope='session')
+def huge_payload(make_payload):
+    """BOM followed by 20000 b'x' bytes, built once per session."""
+    return make_payload(20000)
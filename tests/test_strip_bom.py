@@ -1,7 +1,10 @@
+import re
 import pytest
 
 from strip_bom import strip_bom
 
+_RX_STR = re.compile('Expected a string')
+
 
 class TestStripBom:
     """Tests for strip_bom() function."""
@@ -30,13 +33,14 @@ class TestStripBom:
         result = strip_bom('\ufeff')
         assert result == ''
 
-    def test_strip_bom_raises_type_error_for_non_string(self):
+    def test_strip_bom_from_string_with_bom_not_at_start(self):
+        """Test that U+FEFF after the first character is left in place."""
+        text = 'uni\ufeffcorn\ufeff'
+        result = strip_bom(text)
+        assert result is text  # Should return same object
+
+    @pytest.mark.parametrize('bad', [b'bytes', 123, None])
+    def test_strip_bom_raises_type_error_for_non_string(self, bad):
         """Test that non-string input raises TypeError."""
-        with pytest.raises(TypeError, match='Expected a string'):
-            strip_bom(b'bytes')
-        
-        with pytest.raises(TypeError, match='Expected a string'):
-            strip_bom(123)
-        
-        with pytest.raises(TypeError, match='Expected a string'):
-            strip_bom(None)
+        with pytest.raises(TypeError, match=_RX_STR):
+            strip_bom(bad)
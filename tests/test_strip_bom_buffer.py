@@ -1,6 +1,16 @@
+import re
 import pytest
 
-from strip_bom import strip_bom_buffer
+from strip_bom import (
+    strip_bom_buffer,
+    strip_bom_buffer_bytes,
+    strip_bom_buffer_bytearray,
+)
+
+_RX_BYTES = re.compile('Expected bytes, bytearray, or memoryview')
+
+# Shared across tests; strip_bom_buffer must never mutate its input
+_BA_WITH_BOM = bytearray(b'\xef\xbb\xbfunicorn')
 
 
 class TestStripBomBuffer:
@@ -31,49 +41,66 @@ class TestStripBomBuffer:
 
     def test_strip_bom_from_bytearray(self):
         """Test that bytearray input is handled correctly."""
-        bytearray_with_bom = bytearray(b'\xef\xbb\xbfunicorn')
-        result = strip_bom_buffer(bytearray_with_bom)
+        result = strip_bom_buffer(_BA_WITH_BOM)
         assert result == b'unicorn'
         assert isinstance(result, bytes)
+        assert _BA_WITH_BOM == b'\xef\xbb\xbfunicorn'  # Input left untouched
 
-    def test_strip_bom_does_not_strip_invalid_utf8(self):
-        """Test that BOM is not stripped if bytes are invalid UTF-8."""
-        # BOM followed by invalid UTF-8 sequence
-        invalid_utf8 = b'\xef\xbb\xbf\xff\xfe'
-        result = strip_bom_buffer(invalid_utf8)
-        assert result == invalid_utf8  # Should remain unchanged
+    def test_strip_bom_from_memoryview_with_bom(self):
+        """Test that memoryview input is stripped and returned as bytes."""
+        view = memoryview(b'\xef\xbb\xbfunicorn')
+        result = strip_bom_buffer(view)
+        assert result == b'unicorn'
+        assert isinstance(result, bytes)
 
-    def test_strip_bom_raises_type_error_for_non_bytes(self):
+    def test_strip_bom_from_memoryview_without_bom(self):
+        """Test that memoryview input without BOM is returned as bytes."""
+        result = strip_bom_buffer(memoryview(bytearray(b'unicorn'))[1:])
+        assert result == b'nicorn'
+        assert isinstance(result, bytes)
+
+    def test_strip_bom_from_memoryview_with_wide_format(self):
+        """Test that a memoryview with a non-byte format is read by bytes."""
+        view = memoryview(b'\xef\xbb\xbfunicorn').cast('H')
+        assert strip_bom_buffer(view) == b'unicorn'
+
+    @pytest.mark.parametrize('bad', ['string', 123, None])
+    def test_strip_bom_raises_type_error_for_non_bytes(self, bad):
         """Test that non-bytes input raises TypeError."""
-        with pytest.raises(TypeError, match='Expected bytes or bytearray'):
-            strip_bom_buffer('string')
-        
-        with pytest.raises(TypeError, match='Expected bytes or bytearray'):
-            strip_bom_buffer(123)
-        
-        with pytest.raises(TypeError, match='Expected bytes or bytearray'):
-            strip_bom_buffer(None)
-
-    def test_strip_bom_with_bom_like_prefix_but_invalid_utf8(self):
-        """Test that BOM-like prefix is not stripped if not valid UTF-8."""
-        # Has BOM bytes but invalid UTF-8
-        invalid = b'\xef\xbb\xbf\x80\x81\x82'
-        result = strip_bom_buffer(invalid)
-        assert result == invalid
-
-    def test_strip_bom_buffer_preserves_utf16be_bom(self):
-        """UTF-16BE BOM (0xFE 0xFF) should NOT be stripped by UTF-8 BOM stripper."""
-        utf16be_bom = b'\xfe\xff'
-        content = utf16be_bom + b'\x00H\x00e\x00l\x00l\x00o'
-        result = strip_bom_buffer(content)
-        assert result == content  # Should be unchanged
-
-    def test_strip_bom_buffer_preserves_utf16le_bom(self):
-        """UTF-16LE BOM (0xFF 0xFE) should NOT be stripped by UTF-8 BOM stripper."""
-        utf16le_bom = b'\xff\xfe'
-        content = utf16le_bom + b'H\x00e\x00l\x00l\x00o\x00'
-        result = strip_bom_buffer(content)
-        assert result == content  # Should be unchanged
+        with pytest.raises(TypeError, match=_RX_BYTES):
+            strip_bom_buffer(bad)
+
+    def test_strip_bom_with_ascii_after_bom_skips_full_validation(self):
+        """Test that BOM followed by ASCII is stripped without scanning the rest."""
+        data = b'\xef\xbb\xbfunicorn\xff'
+        result = strip_bom_buffer(data)
+        assert result == b'unicorn\xff'
+
+    def test_strip_bom_with_invalid_byte_after_first_code_point(self):
+        """Test that only the first code point after the BOM decides."""
+        data = b'\xef\xbb\xbfa\xff'
+        result = strip_bom_buffer(data)
+        assert result == b'a\xff'
+
+    def test_strip_bom_from_utf8_fixture_bytes(self, utf8_fixture_bytes):
+        """Test stripping BOM from the contents of the UTF-8 fixture file."""
+        result = strip_bom_buffer(utf8_fixture_bytes)
+        assert result == b'Unicorn\n'
+
+    @pytest.mark.parametrize('payload', [
+        pytest.param(b'\xef', id='first-bom-byte-only'),
+        pytest.param(b'\xef\xbb', id='two-bom-bytes-only'),
+        pytest.param(b'\xef\xbbunicorn', id='partial-bom'),
+        pytest.param(b'\xfe\xff\x00H\x00i', id='utf16be-bom'),
+        pytest.param(b'\xff\xfeH\x00i\x00', id='utf16le-bom'),
+        pytest.param(b'\xef\xbb\xbf\xff\xfe', id='bom-then-invalid-byte'),
+        pytest.param(b'\xef\xbb\xbf\x80\x81\x82', id='bom-then-continuation-bytes'),
+        pytest.param(b'\xef\xbb\xbf\xc3', id='bom-then-truncated-sequence'),
+        pytest.param(b'hello\xef\xbb\xbfworld', id='bom-in-middle'),
+    ])
+    def test_strip_bom_buffer_preserves_input(self, payload):
+        """Test that bytes without a strippable BOM are returned as the same object."""
+        assert strip_bom_buffer(payload) is payload
 
     def test_strip_bom_buffer_returns_same_object_without_bom(self):
         """Verify no unnecessary copying when no BOM present (bytes only)."""
@@ -81,6 +108,15 @@ class TestStripBomBuffer:
         result = strip_bom_buffer(data)
         assert result is data  # Same object, not a copy
 
+    def test_strip_bom_buffer_returns_same_bytes_subclass_without_bom(self):
+        """Verify a bytes subclass without BOM is returned as is, like bytes."""
+        class Payload(bytes):
+            pass
+
+        data = Payload(b'Hello World')
+        result = strip_bom_buffer(data)
+        assert result is data
+
     def test_strip_bom_buffer_bytearray_returns_new_object(self):
         """Verify bytearray always returns a new bytes object."""
         data = bytearray(b'Hello World')
@@ -88,3 +124,57 @@ class TestStripBomBuffer:
         assert result is not data  # Always a new object
         assert isinstance(result, bytes)  # Converted to bytes
         assert result == b'Hello World'  # Content is correct
+
+    def test_strip_bom_buffer_strips_bytearray_subclass(self):
+        """Verify a bytearray subclass is handled like bytearray."""
+        class Buffer(bytearray):
+            pass
+
+        result = strip_bom_buffer(Buffer(b'\xef\xbb\xbfunicorn'))
+        assert type(result) is bytes
+        assert result == b'unicorn'
+
+
+class TestStripBomBufferBytes:
+    """Tests for strip_bom_buffer_bytes() function."""
+
+    def test_strip_bom_from_bytes_with_bom(self):
+        """Test stripping BOM from bytes that has BOM."""
+        assert strip_bom_buffer_bytes(b'\xef\xbb\xbfunicorn') == b'unicorn'
+
+    def test_strip_bom_from_bytes_with_only_bom(self):
+        """Test bytes containing only BOM."""
+        assert strip_bom_buffer_bytes(b'\xef\xbb\xbf') == b''
+
+    def test_strip_bom_returns_same_object_without_bom(self):
+        """Test bytes without BOM are returned as the same object."""
+        data = b'unicorn'
+        assert strip_bom_buffer_bytes(data) is data
+
+    def test_strip_bom_does_not_strip_invalid_utf8(self):
+        """Test that BOM is not stripped if followed by invalid UTF-8."""
+        invalid_utf8 = b'\xef\xbb\xbf\xff\xfe'
+        assert strip_bom_buffer_bytes(invalid_utf8) is invalid_utf8
+
+
+class TestStripBomBufferBytearray:
+    """Tests for strip_bom_buffer_bytearray() function."""
+
+    def test_strip_bom_from_bytearray_with_bom(self):
+        """Test stripping BOM from bytearray that has BOM."""
+        result = strip_bom_buffer_bytearray(_BA_WITH_BOM)
+        assert result == b'unicorn'
+        assert isinstance(result, bytes)
+        assert _BA_WITH_BOM == b'\xef\xbb\xbfunicorn'  # Input left untouched
+
+    def test_strip_bom_from_bytearray_without_bom(self):
+        """Test bytearray without BOM is returned as bytes."""
+        data = bytearray(b'unicorn')
+        result = strip_bom_buffer_bytearray(data)
+        assert result == b'unicorn'
+        assert isinstance(result, bytes)
+
+    def test_strip_bom_does_not_strip_invalid_utf8(self):
+        """Test that BOM is not stripped if followed by invalid UTF-8."""
+        invalid_utf8 = bytearray(b'\xef\xbb\xbf\x80\x81')
+        assert strip_bom_buffer_bytearray(invalid_utf8) == bytes(invalid_utf8)
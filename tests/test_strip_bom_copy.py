@@ -0,0 +1,143 @@
+import io
+import os
+import re
+import pytest
+
+from strip_bom import strip_bom_copy
+
+_RX_FILE_LIKE = re.compile('Expected a file-like object')
+_RX_WRITABLE = re.compile('Expected a writable file-like object')
+
+
+class TestStripBomCopy:
+    """Tests for strip_bom_copy() function."""
+
+    def test_strip_bom_copy_with_bom(self):
+        """Test copying a stream with BOM."""
+        src = io.BytesIO(b'\xef\xbb\xbfunicorn')
+        dst = io.BytesIO()
+        written = strip_bom_copy(src, dst)
+        assert dst.getvalue() == b'unicorn'
+        assert written == 7
+
+    def test_strip_bom_copy_without_bom(self):
+        """Test copying a stream without BOM leaves content unchanged."""
+        src = io.BytesIO(b'unicorn')
+        dst = io.BytesIO()
+        written = strip_bom_copy(src, dst)
+        assert dst.getvalue() == b'unicorn'
+        assert written == 7
+
+    def test_strip_bom_copy_with_empty_stream(self):
+        """Test copying an empty stream."""
+        dst = io.BytesIO()
+        assert strip_bom_copy(io.BytesIO(b''), dst) == 0
+        assert dst.getvalue() == b''
+
+    @pytest.mark.parametrize('chunk_size', [1, 1 << 20])
+    def test_strip_bom_copy_with_truncated_sequence_at_end(self, chunk_size):
+        """Test that a cut-off sequence after the BOM keeps it, like strip_bom_buffer."""
+        dst = io.BytesIO()
+        written = strip_bom_copy(io.BytesIO(b'\xef\xbb\xbf\xc3'), dst, chunk_size=chunk_size)
+        assert dst.getvalue() == b'\xef\xbb\xbf\xc3'
+        assert written == 4
+
+    def test_strip_bom_copy_with_multiple_chunks(self, huge_payload):
+        """Test copying a stream that requires multiple reads."""
+        src = io.BytesIO(huge_payload)
+        dst = io.BytesIO()
+        written = strip_bom_copy(src, dst, chunk_size=1000)
+        assert dst.getvalue() == b'x' * 20000
+        assert written == 20000
+
+    def test_strip_bom_copy_between_files(self, bom, tmp_path):
+        """Test copying between real files, where sendfile may be used."""
+        src_path = tmp_path / 'src.txt'
+        dst_path = tmp_path / 'dst.txt'
+        content = b'y' * 100000
+        src_path.write_bytes(bom + content)
+
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            written = strip_bom_copy(src, dst, chunk_size=4096)
+            # File positions reflect everything that was copied
+            assert src.tell() == len(content) + 3
+            assert dst.tell() == len(content)
+            dst.write(b'!')
+
+        assert written == len(content)
+        assert dst_path.read_bytes() == content + b'!'
+
+    @pytest.mark.skipif(not hasattr(os, 'sendfile'), reason='os.sendfile is not available')
+    def test_strip_bom_copy_between_files_uses_sendfile(self, bom, tmp_path, monkeypatch):
+        """Test that the rest of a real file is copied with os.sendfile."""
+        calls = []
+        real_sendfile = os.sendfile
+
+        def recording_sendfile(*args):
+            calls.append(args)
+            return real_sendfile(*args)
+
+        monkeypatch.setattr(os, 'sendfile', recording_sendfile)
+        src_path = tmp_path / 'src.txt'
+        dst_path = tmp_path / 'dst.txt'
+        content = b'y' * 100000
+        src_path.write_bytes(bom + content)
+
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            written = strip_bom_copy(src, dst, chunk_size=4096)
+            assert src.tell() == len(content) + 3
+            assert dst.tell() == len(content)
+
+        assert calls
+        assert written == len(content)
+        assert dst_path.read_bytes() == content
+
+    @pytest.mark.skipif(not hasattr(os, 'sendfile'), reason='os.sendfile is not available')
+    def test_strip_bom_copy_falls_back_when_sendfile_fails(self, bom, tmp_path, monkeypatch):
+        """Test that an OSError from the first sendfile call falls back to read/write."""
+        calls = []
+
+        def failing_sendfile(*args):
+            calls.append(args)
+            raise OSError('sendfile not supported')
+
+        monkeypatch.setattr(os, 'sendfile', failing_sendfile)
+        src_path = tmp_path / 'src.txt'
+        dst_path = tmp_path / 'dst.txt'
+        content = b'y' * 100000
+        src_path.write_bytes(bom + content)
+
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            written = strip_bom_copy(src, dst, chunk_size=4096)
+            assert src.tell() == len(content) + 3
+            assert dst.tell() == len(content)
+
+        assert len(calls) == 1
+        assert written == len(content)
+        assert dst_path.read_bytes() == content
+
+    def test_strip_bom_copy_from_pipe(self, bom, tmp_path, monkeypatch):
+        """Test that a non-seekable source is copied without sendfile."""
+        calls = []
+        monkeypatch.setattr(os, 'sendfile', lambda *args: calls.append(args), raising=False)
+        dst_path = tmp_path / 'dst.txt'
+        content = b'y' * 10000
+        read_fd, write_fd = os.pipe()
+        with open(write_fd, 'wb') as writer:
+            writer.write(bom + content)
+
+        with open(read_fd, 'rb') as src, open(dst_path, 'wb') as dst:
+            written = strip_bom_copy(src, dst, chunk_size=4096)
+            assert dst.tell() == len(content)
+
+        assert not calls
+        assert written == len(content)
+        assert dst_path.read_bytes() == content
+
+    def test_strip_bom_copy_raises_type_error_for_non_file_like(self):
+        """Test that non-file-like input raises TypeError."""
+        with pytest.raises(TypeError, match=_RX_FILE_LIKE):
+            strip_bom_copy('not a stream', io.BytesIO())
+
+        with pytest.raises(TypeError, match=_RX_WRITABLE):
+            strip_bom_copy(io.BytesIO(b'unicorn'), None)
@@ -1,113 +1,143 @@
-import tempfile
+import io
+import re
 import pytest
-from pathlib import Path
 
 from strip_bom import strip_bom_file
 
+_RX_MODE = re.compile("Mode must be 'r', 'rt', or 'rb'")
+_RX_BYTES = re.compile('Expected bytes')
+
+
+@pytest.fixture(scope='module')
+def bom_file(tmp_path_factory):
+    """Path to a file containing a BOM followed by 'unicorn'."""
+    path = tmp_path_factory.mktemp('files') / 'bom.txt'
+    path.write_bytes(b'\xef\xbb\xbfunicorn')
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def no_bom_file(tmp_path_factory):
+    """Path to a file containing 'unicorn' without a BOM."""
+    path = tmp_path_factory.mktemp('files') / 'no_bom.txt'
+    path.write_bytes(b'unicorn')
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def empty_file(tmp_path_factory):
+    """Path to an empty file."""
+    path = tmp_path_factory.mktemp('files') / 'empty.txt'
+    path.write_bytes(b'')
+    return str(path)
+
 
 class TestStripBomFile:
     """Tests for strip_bom_file() function."""
 
-    def test_strip_bom_file_text_mode_with_bom(self):
+    def test_strip_bom_file_text_mode_with_bom(self, bom_file):
         """Test reading file in text mode with BOM."""
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-            f.write('\ufeffunicorn')
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'r')
-            assert result == 'unicorn'
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(bom_file, 'r')
+        assert result == 'unicorn'
 
-    def test_strip_bom_file_text_mode_without_bom(self):
+    def test_strip_bom_file_text_mode_without_bom(self, no_bom_file):
         """Test reading file in text mode without BOM."""
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-            f.write('unicorn')
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'r')
-            assert result == 'unicorn'
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(no_bom_file, 'r')
+        assert result == 'unicorn'
+
+    def test_strip_bom_file_text_mode_strips_only_leading_bom(self, tmp_path):
+        """Test that text mode removes a single leading BOM, like strip_bom()."""
+        path = tmp_path / 'file.txt'
+        path.write_text('\ufeff\ufeffunicorn\ufeff', encoding='utf-8')
+        result = strip_bom_file(str(path), 'r')
+        assert result == '\ufeffunicorn\ufeff'
 
-    def test_strip_bom_file_binary_mode_with_bom(self):
+    def test_strip_bom_file_binary_mode_with_bom(self, bom_file):
         """Test reading file in binary mode with BOM."""
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(b'\xef\xbb\xbfunicorn')
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'rb')
-            assert result == b'unicorn'
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(bom_file, 'rb')
+        assert result == b'unicorn'
 
-    def test_strip_bom_file_binary_mode_without_bom(self):
+    def test_strip_bom_file_binary_mode_without_bom(self, no_bom_file):
         """Test reading file in binary mode without BOM."""
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(b'unicorn')
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'rb')
-            assert result == b'unicorn'
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(no_bom_file, 'rb')
+        assert result == b'unicorn'
 
-    def test_strip_bom_file_with_rt_mode(self):
+    def test_strip_bom_file_with_rt_mode(self, bom_file):
         """Test reading file with 'rt' mode (same as 'r')."""
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-            f.write('\ufeffunicorn')
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'rt')
-            assert result == 'unicorn'
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(bom_file, 'rt')
+        assert result == 'unicorn'
 
-    def test_strip_bom_file_raises_value_error_for_invalid_mode(self):
+    def test_strip_bom_file_raises_value_error_for_invalid_mode(self, no_bom_file):
         """Test that invalid mode raises ValueError."""
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-            f.write('test')
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="Mode must be 'r', 'rt', or 'rb'"):
-                strip_bom_file(temp_path, 'w')
-            
-            with pytest.raises(ValueError, match="Mode must be 'r', 'rt', or 'rb'"):
-                strip_bom_file(temp_path, 'x')
-        finally:
-            Path(temp_path).unlink()
-
-    def test_strip_bom_file_with_empty_file(self):
+        with pytest.raises(ValueError, match=_RX_MODE):
+            strip_bom_file(no_bom_file, 'w')
+
+        with pytest.raises(ValueError, match=_RX_MODE):
+            strip_bom_file(no_bom_file, 'x')
+
+    def test_strip_bom_file_with_empty_file(self, empty_file):
         """Test reading empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            result = strip_bom_file(temp_path, 'r')
-            assert result == ''
-        finally:
-            Path(temp_path).unlink()
+        result = strip_bom_file(empty_file, 'r')
+        assert result == ''
+
+    def test_strip_bom_file_with_binary_file_object(self):
+        """Test passing an open binary file object instead of a path."""
+        stream = io.BytesIO(b'\xef\xbb\xbfunicorn')
+        assert strip_bom_file(stream, 'rb') == b'unicorn'
+        assert not stream.closed  # Caller keeps ownership of the file object
+
+    def test_strip_bom_file_with_binary_file_object_in_text_mode(self):
+        """Test that bytes read in text mode are decoded as UTF-8."""
+        stream = io.BytesIO(b'\xef\xbb\xbfunicorn')
+        assert strip_bom_file(stream, 'r') == 'unicorn'
+
+    def test_strip_bom_file_object_strips_only_leading_bom(self):
+        """Test that a file object in text mode keeps all but the leading BOM."""
+        content = '\ufeff\ufeffunicorn\ufeff'.encode('utf-8')
+        result = strip_bom_file(io.BytesIO(content), 'r')
+        assert result == '\ufeffunicorn\ufeff'
 
-    def test_strip_bom_file_with_utf8_fixture(self):
+    def test_strip_bom_file_object_translates_newlines_like_path(self, tmp_path):
+        """Test that a binary file object and its path give the same text."""
+        path = tmp_path / 'crlf.txt'
+        path.write_bytes(b'\xef\xbb\xbfa\r\nb\rc')
+        with open(path, 'rb') as f:
+            from_object = strip_bom_file(f, 'r')
+        assert from_object == 'a\nb\nc'
+        assert from_object == strip_bom_file(str(path), 'r')
+
+    def test_strip_bom_file_object_raises_value_error_for_invalid_mode(self):
+        """Test that the mode is checked before a file object is read."""
+        stream = io.BytesIO(b'test')
+        with pytest.raises(ValueError, match=_RX_MODE):
+            strip_bom_file(stream, 'w')
+        assert stream.tell() == 0
+
+    def test_strip_bom_file_raises_type_error_for_text_object_in_binary_mode(self):
+        """Test that 'rb' on a file object returning str raises TypeError."""
+        with pytest.raises(TypeError, match=_RX_BYTES):
+            strip_bom_file(io.StringIO('unicorn'), 'rb')
+
+    def test_strip_bom_file_with_text_file_object(self):
+        """Test passing an open text file object instead of a path."""
+        stream = io.StringIO('\ufeffunicorn')
+        assert strip_bom_file(stream, 'rt') == 'unicorn'
+
+    def test_strip_bom_file_with_empty_file_object(self):
+        """Test reading an empty file object."""
+        assert strip_bom_file(io.BytesIO(b''), 'r') == ''
+        assert strip_bom_file(io.BytesIO(b''), 'rb') == b''
+
+    def test_strip_bom_file_with_utf8_fixture(self, utf8_fixture_path):
         """Test with UTF-8 fixture file containing BOM.
         
         Fixture file is located at tests/fixtures/fixture-utf8.
         """
-        fixtures_dir = Path(__file__).parent / 'fixtures'
-        utf8_fixture = fixtures_dir / 'fixture-utf8'
-        
         # Test UTF-8 fixture: BOM should be stripped
-        result_utf8 = strip_bom_file(str(utf8_fixture), 'rb')
+        result_utf8 = strip_bom_file(utf8_fixture_path, 'rb')
         assert result_utf8 == b'Unicorn\n'
 
-    def test_strip_bom_file_with_directory_path(self):
+    def test_strip_bom_file_with_directory_path(self, tmp_path):
         """Test error handling when path is a directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(IsADirectoryError):
-                strip_bom_file(tmpdir)
+        with pytest.raises(IsADirectoryError):
+            strip_bom_file(str(tmp_path))
@@ -1,7 +1,20 @@
 import io
+import re
 import pytest
 
-from strip_bom import strip_bom_stream
+from strip_bom import strip_bom_stream, strip_bom_stream_bytes
+
+_RX_FILE_LIKE = re.compile('Expected a file-like object')
+
+
+class _TrickleStream:
+    """Binary stream that returns at most one byte per read, like a slow pipe."""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(1)
 
 
 class TestStripBomStream:
@@ -10,15 +23,13 @@ class TestStripBomStream:
     def test_strip_bom_from_stream_with_bom(self):
         """Test stripping BOM from BytesIO stream with BOM."""
         stream = io.BytesIO(b'\xef\xbb\xbfunicorn')
-        chunks = list(strip_bom_stream(stream))
-        result = b''.join(chunks)
+        result = b''.join(strip_bom_stream(stream))
         assert result == b'unicorn'
 
     def test_strip_bom_from_stream_without_bom(self):
         """Test stream without BOM remains unchanged."""
         stream = io.BytesIO(b'unicorn')
-        chunks = list(strip_bom_stream(stream))
-        result = b''.join(chunks)
+        result = b''.join(strip_bom_stream(stream))
         assert result == b'unicorn'
 
     def test_strip_bom_from_empty_stream(self):
@@ -30,8 +41,7 @@ class TestStripBomStream:
     def test_strip_bom_from_stream_with_only_bom(self):
         """Test stream containing only BOM."""
         stream = io.BytesIO(b'\xef\xbb\xbf')
-        chunks = list(strip_bom_stream(stream))
-        result = b''.join(chunks)
+        result = b''.join(strip_bom_stream(stream))
         assert result == b''
 
     def test_strip_bom_stream_with_minimal_chunk_size(self):
@@ -41,16 +51,42 @@ class TestStripBomStream:
         result = b''.join(strip_bom_stream(stream, chunk_size=1))
         assert result == b'Hello'
 
-    def test_strip_bom_raises_type_error_for_non_file_like(self):
+    def test_strip_bom_stream_with_short_reads(self):
+        """Test that BOM is found when reads return fewer bytes than requested."""
+        stream = _TrickleStream(b'\xef\xbb\xbfHello')
+        result = b''.join(strip_bom_stream(stream))
+        assert result == b'Hello'
+
+    def test_strip_bom_stream_with_short_reads_without_bom(self):
+        """Test that short reads of a stream without BOM keep every byte."""
+        stream = _TrickleStream(b'\xefH')
+        result = b''.join(strip_bom_stream(stream))
+        assert result == b'\xefH'
+
+    def test_strip_bom_stream_with_sequence_split_across_chunks(self):
+        """Test a multi-byte sequence after the BOM split by the first read."""
+        stream = io.BytesIO(b'\xef\xbb\xbf' + '\u00e9t\u00e9'.encode('utf-8'))
+        result = b''.join(strip_bom_stream(stream, chunk_size=4))
+        assert result == '\u00e9t\u00e9'.encode('utf-8')
+
+    @pytest.mark.parametrize('chunk_size', [1, 65536])
+    def test_strip_bom_stream_with_truncated_sequence_at_end(self, chunk_size):
+        """Test that a stream ending in a cut-off sequence after the BOM keeps it."""
+        stream = io.BytesIO(b'\xef\xbb\xbf\xc3')
+        result = b''.join(strip_bom_stream(stream, chunk_size=chunk_size))
+        assert result == b'\xef\xbb\xbf\xc3'
+
+    def test_strip_bom_stream_with_short_reads_and_truncated_sequence(self):
+        """Test that short reads do not make a cut-off sequence look complete."""
+        stream = _TrickleStream(b'\xef\xbb\xbf\xc3')
+        result = b''.join(strip_bom_stream(stream))
+        assert result == b'\xef\xbb\xbf\xc3'
+
+    @pytest.mark.parametrize('bad', ['not a stream', 123, None])
+    def test_strip_bom_raises_type_error_for_non_file_like(self, bad):
         """Test that non-file-like input raises TypeError."""
-        with pytest.raises(TypeError, match='Expected a file-like object'):
-            strip_bom_stream('not a stream')
-        
-        with pytest.raises(TypeError, match='Expected a file-like object'):
-            strip_bom_stream(123)
-        
-        with pytest.raises(TypeError, match='Expected a file-like object'):
-            strip_bom_stream(None)
+        with pytest.raises(TypeError, match=_RX_FILE_LIKE):
+            strip_bom_stream(bad)
 
     def test_strip_bom_stream_with_closed_stream(self):
         """Test behavior when stream is already closed."""
@@ -59,10 +95,60 @@ class TestStripBomStream:
         with pytest.raises(ValueError):
             list(strip_bom_stream(stream))
 
-    def test_strip_bom_stream_early_termination(self):
+    @pytest.mark.parametrize('chunk_size,expect_multiple', [
+        (10, True),
+        (1000, True),
+        (1024, True),
+        (100000, False),
+        (None, False),  # Default chunk size
+    ])
+    def test_strip_bom_stream_with_chunk_sizes(self, huge_payload, chunk_size, expect_multiple):
+        """Test stream content and chunking across chunk sizes."""
+        stream = io.BytesIO(huge_payload)
+        if chunk_size is None:
+            chunks = list(strip_bom_stream(stream))
+        else:
+            chunks = list(strip_bom_stream(stream, chunk_size=chunk_size))
+        assert b''.join(chunks) == b'x' * 20000
+        assert (len(chunks) > 1) == expect_multiple
+
+    def test_strip_bom_stream_early_termination(self, large_payload):
         """Test that generator can be safely terminated early."""
-        content = b'\xef\xbb\xbf' + b'x' * 10000
-        stream = io.BytesIO(content)
+        stream = io.BytesIO(large_payload)
         gen = strip_bom_stream(stream)
         first_chunk = next(gen)
         gen.close()  # Should not raise
+
+
+class TestStripBomStreamBytes:
+    """Tests for strip_bom_stream_bytes() function."""
+
+    def test_strip_bom_from_stream_with_bom(self):
+        """Test stripping BOM from BytesIO stream with BOM."""
+        stream = io.BytesIO(b'\xef\xbb\xbfunicorn')
+        assert strip_bom_stream_bytes(stream) == b'unicorn'
+
+    def test_strip_bom_from_stream_without_bom(self):
+        """Test stream without BOM remains unchanged."""
+        stream = io.BytesIO(b'unicorn')
+        assert strip_bom_stream_bytes(stream) == b'unicorn'
+
+    def test_strip_bom_from_empty_stream(self):
+        """Test empty stream handling."""
+        assert strip_bom_stream_bytes(io.BytesIO(b'')) == b''
+
+    def test_strip_bom_from_stream_with_single_byte_after_bom(self):
+        """Test stream with single byte after BOM."""
+        stream = io.BytesIO(b'\xef\xbb\xbfx')
+        assert strip_bom_stream_bytes(stream) == b'x'
+
+    def test_strip_bom_from_stream_with_truncated_sequence_at_end(self):
+        """Test that a cut-off sequence after the BOM keeps it, like strip_bom_stream."""
+        stream = io.BytesIO(b'\xef\xbb\xbf\xc3')
+        assert strip_bom_stream_bytes(stream) == b'\xef\xbb\xbf\xc3'
+
+    @pytest.mark.parametrize('bad', ['not a stream', 123, None])
+    def test_strip_bom_raises_type_error_for_non_file_like(self, bad):
+        """Test that non-file-like input raises TypeError."""
+        with pytest.raises(TypeError, match=_RX_FILE_LIKE):
+            strip_bom_stream_bytes(bad)